@@ -3,16 +3,21 @@
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
+import inspect
+import itertools
 import logging
+import os
+import sys
 import threading
-import time
-from collections.abc import Callable
-from functools import wraps
+from collections.abc import Awaitable, Callable, Coroutine
+from functools import partial, wraps
 from pathlib import Path
-from queue import Queue
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 import telegram
+from telegram.error import BadRequest
+from telegram.request import HTTPXRequest
 
 from .config import CONSTANTS, Settings, get_settings
 from .exceptions import NotInitializedError
@@ -21,31 +26,48 @@ from .handlers import HandlerRegistry, MessageHandler
 if TYPE_CHECKING:
     from telegram import Update
 
+logger = logging.getLogger(__name__)
+
 # Disable httpx logging
 logging.getLogger("httpx").setLevel(logging.WARNING)
 
+# Use uvloop/winloop for the internal event loop when the "speedups" extra is installed
+_new_event_loop: Callable[[], asyncio.AbstractEventLoop]
+try:
+    # Optional and platform-specific, so stubs may be missing or the ignore unused
+    if sys.platform == "win32":
+        import winloop as _fast_loop  # type: ignore[import-not-found, unused-ignore]
+    else:
+        import uvloop as _fast_loop  # type: ignore[import-not-found, unused-ignore]
+    _new_event_loop = _fast_loop.new_event_loop
+except ImportError:
+    _new_event_loop = asyncio.new_event_loop
+
 F = TypeVar("F", bound=Callable[..., Any])
 
+# Send queue priorities; lower values are sent first
+_PRIORITY_DIRECT = 0
+_PRIORITY_CHANNEL = 1
 
-def requires_initialization(func: F) -> F:
-    """Decorator to ensure bot is initialized before method execution."""
+# (priority, sequence, message, chat_id); the sequence keeps FIFO order per priority
+_QueueItem = tuple[int, int, str, int | None]
 
-    @wraps(func)
-    def wrapper(self: TelegramBot, *args: Any, **kwargs: Any) -> Any:
-        if not TelegramBot._initialized:
-            raise NotInitializedError(CONSTANTS.ERR_NOT_INITIALIZED)
-        return func(self, *args, **kwargs)
+# Send methods that skip the initialization check once initialize() has run
+_FAST_PATH_METHODS = ("send_message_sync", "reply_to_user", "send_url_sync")
 
-    return wrapper  # type: ignore[return-value]
+
+def _strip_path(path: str) -> str:
+    """Build a URL from a path when no base URL is configured."""
+    return path.lstrip("/")
 
 
-def warns_no_handlers(func: F) -> F:
-    """Decorator to warn if no message handlers are registered."""
+def requires_initialization(func: F) -> F:
+    """Decorator to ensure bot is initialized before method execution."""
 
     @wraps(func)
     def wrapper(self: TelegramBot, *args: Any, **kwargs: Any) -> Any:
-        if not TelegramBot._handler_registry:
-            print(CONSTANTS.LOG_NO_HANDLERS_WARNING)
+        if not TelegramBot._initialized:
+            raise NotInitializedError(CONSTANTS.ERR_NOT_INITIALIZED)
         return func(self, *args, **kwargs)
 
     return wrapper  # type: ignore[return-value]
@@ -56,8 +78,10 @@ class TelegramBot:
     Singleton Telegram bot with async message handling.
 
     This class implements a thread-safe singleton pattern for managing
-    Telegram bot communications. It supports both channel messages and
-    direct messages through separate queues.
+    Telegram bot communications. All Telegram I/O runs on one asyncio
+    event loop in a background thread; the synchronous methods hand work
+    to it. Channel and direct messages share a priority queue, with
+    direct messages sent first.
 
     Usage:
         bot = TelegramBot.get_instance()
@@ -69,15 +93,21 @@ class TelegramBot:
 
     _instance: TelegramBot | None = None
     _initialized: bool = False
+    _warned_no_handlers: bool = False
     _bot: telegram.Bot | None = None
     _settings: Settings | None = None
-    _channel_queue: Queue[str] = Queue()
-    _direct_queue: Queue[tuple[str, int]] = Queue()
-    _worker_thread: threading.Thread | None = None
-    _polling_thread: threading.Thread | None = None
-    _stop_flag: bool = False
-    _is_polling: bool = False
+    _build_url: Callable[[str], str] = _strip_path
+    _send_queue: asyncio.PriorityQueue[_QueueItem] = asyncio.PriorityQueue()
+    _sequence: itertools.count[int] = itertools.count()
+    _runner_thread: threading.Thread | None = None
+    _polling_task: concurrent.futures.Future[None] | None = None
+    _stop_event: asyncio.Event = asyncio.Event()
     _loop: asyncio.AbstractEventLoop | None = None
+    _send_semaphore: asyncio.Semaphore | None = None
+    _background_tasks: set[asyncio.Task[None]] = set()
+    _chat_sends: dict[int | None, asyncio.Task[None]] = {}
+    _chat_workers: dict[int, asyncio.Queue[Update]] = {}
+    _pending_updates: set[int] = set()
     _handler_registry: HandlerRegistry = HandlerRegistry()
     _lock: threading.Lock = threading.Lock()
 
@@ -109,20 +139,25 @@ class TelegramBot:
         with cls._lock:
             if cls._instance is not None:
                 try:
-                    cls._instance.shutdown()
+                    cls._instance.shutdown(wait=True)
                 except Exception:
                     pass
             cls._instance = None
             cls._initialized = False
+            cls._warned_no_handlers = False
             cls._bot = None
             cls._settings = None
-            cls._channel_queue = Queue()
-            cls._direct_queue = Queue()
-            cls._worker_thread = None
-            cls._polling_thread = None
-            cls._stop_flag = False
-            cls._is_polling = False
+            cls._build_url = _strip_path
+            cls._send_queue = asyncio.PriorityQueue()
+            cls._runner_thread = None
+            cls._polling_task = None
+            cls._stop_event = asyncio.Event()
             cls._loop = None
+            cls._send_semaphore = None
+            cls._background_tasks = set()
+            cls._chat_sends = {}
+            cls._chat_workers = {}
+            cls._pending_updates = set()
             cls._handler_registry = HandlerRegistry()
 
     def initialize(
@@ -143,6 +178,8 @@ class TelegramBot:
         if TelegramBot._initialized:
             return
 
+        # Only the first, possibly racing, initialization takes the lock;
+        # afterwards initialize() is rebound to a no-op below
         with TelegramBot._lock:
             if TelegramBot._initialized:
                 return
@@ -152,15 +189,44 @@ class TelegramBot:
             else:
                 TelegramBot._settings = get_settings(env_path)
 
-            TelegramBot._bot = telegram.Bot(token=TelegramBot._settings.bot_token)
-            TelegramBot._stop_flag = False
+            # Share one connection pool between long-polling and sends so both
+            # reuse warm keep-alive connections on the same event loop
+            request = HTTPXRequest(connection_pool_size=CONSTANTS.CONNECTION_POOL_SIZE)
+            TelegramBot._bot = telegram.Bot(
+                token=TelegramBot._settings.bot_token,
+                request=request,
+                get_updates_request=request,
+            )
 
-            # Start worker thread
-            if TelegramBot._worker_thread is None or not TelegramBot._worker_thread.is_alive():
-                TelegramBot._worker_thread = threading.Thread(
-                    target=self._message_worker, daemon=True
-                )
-                TelegramBot._worker_thread.start()
+            # Fresh loop primitives for the runner's event loop
+            TelegramBot._stop_event = asyncio.Event()
+            TelegramBot._send_queue = asyncio.PriorityQueue()
+            TelegramBot._chat_workers = {}
+            TelegramBot._pending_updates = set()
+            TelegramBot._chat_sends = {}
+            TelegramBot._send_semaphore = asyncio.Semaphore(CONSTANTS.MAX_CONCURRENT_SENDS)
+
+            # Start the event loop thread that drives both sending and polling
+            runner = asyncio.Runner(loop_factory=_new_event_loop)
+            TelegramBot._loop = runner.get_loop()
+            TelegramBot._runner_thread = threading.Thread(
+                target=self._run_loop, args=(runner,), daemon=True
+            )
+            TelegramBot._runner_thread.start()
+
+            # Capture the base URL once so send_url_sync is a single f-string
+            base_url_prefix = TelegramBot._settings.base_url_prefix
+            if base_url_prefix:
+                TelegramBot._build_url = lambda path: f"{base_url_prefix}/{path.lstrip('/')}"
+            else:
+                TelegramBot._build_url = _strip_path
+
+            # Bind the undecorated send methods on the instance; shutdown()
+            # removes them so the initialization check applies again
+            for name in _FAST_PATH_METHODS:
+                method = getattr(TelegramBot, name).__wrapped__
+                setattr(self, name, method.__get__(self, TelegramBot))
+            setattr(self, "initialize", self._skip_initialize)
 
             TelegramBot._initialized = True
 
@@ -203,41 +269,38 @@ class TelegramBot:
         to receive incoming messages.
         """
         if not TelegramBot._handler_registry:
-            print(CONSTANTS.LOG_NO_HANDLERS_START)
+            logger.warning(CONSTANTS.LOG_NO_HANDLERS_START)
             return
 
-        if not TelegramBot._is_polling:
-            TelegramBot._is_polling = True
-            if TelegramBot._polling_thread is None or not TelegramBot._polling_thread.is_alive():
-                TelegramBot._polling_thread = threading.Thread(
-                    target=self._start_polling, daemon=True
-                )
-                TelegramBot._polling_thread.start()
-                print(CONSTANTS.LOG_STARTED_RECEIVING)
+        polling_task = TelegramBot._polling_task
+        if TelegramBot._loop is not None and (polling_task is None or polling_task.done()):
+            TelegramBot._polling_task = asyncio.run_coroutine_threadsafe(
+                self._poll_updates(), TelegramBot._loop
+            )
+            logger.info(CONSTANTS.LOG_STARTED_RECEIVING)
 
     def stop_receiving(self) -> None:
         """Stop receiving messages from Telegram."""
-        TelegramBot._is_polling = False
-        if TelegramBot._polling_thread is not None and TelegramBot._polling_thread.is_alive():
-            TelegramBot._polling_thread.join(timeout=5.0)
-        print(CONSTANTS.LOG_STOPPED_RECEIVING)
+        if TelegramBot._polling_task is not None:
+            TelegramBot._polling_task.cancel()
+            TelegramBot._polling_task = None
+        logger.info(CONSTANTS.LOG_STOPPED_RECEIVING)
 
     @requires_initialization
-    @warns_no_handlers
     def send_message_sync(self, message: str) -> None:
         """
         Send a message to the configured channel.
 
-        This method is synchronous but uses a background worker thread
-        to actually send the message.
+        This method is synchronous but hands the message to the background
+        event loop to actually send it.
 
         Args:
             message: The message text to send.
         """
-        TelegramBot._channel_queue.put(message)
+        self._warn_if_no_handlers()
+        self._enqueue(_PRIORITY_CHANNEL, message)
 
     @requires_initialization
-    @warns_no_handlers
     def reply_to_user(self, message: str, chat_id: int) -> None:
         """
         Send a direct message to a specific user.
@@ -246,10 +309,10 @@ class TelegramBot:
             message: The message text to send.
             chat_id: The chat ID of the user to send to.
         """
-        TelegramBot._direct_queue.put((message, chat_id))
+        self._warn_if_no_handlers()
+        self._enqueue(_PRIORITY_DIRECT, message, chat_id)
 
     @requires_initialization
-    @warns_no_handlers
     def send_url_sync(self, path: str) -> None:
         """
         Send a URL with the configured base URL prefix.
@@ -257,13 +320,8 @@ class TelegramBot:
         Args:
             path: The path to append to the base URL.
         """
-        if TelegramBot._settings is None:
-            raise NotInitializedError(CONSTANTS.ERR_NOT_INITIALIZED)
-
-        base = TelegramBot._settings.base_url.rstrip("/")
-        path_clean = path.lstrip("/")
-        full_url = f"{base}/{path_clean}" if base else path_clean
-        TelegramBot._channel_queue.put(full_url)
+        self._warn_if_no_handlers()
+        self._enqueue(_PRIORITY_CHANNEL, TelegramBot._build_url(path))
 
     def flush(self, timeout: float = 10.0) -> None:
         """Block until all queued messages have been sent.
@@ -271,115 +329,334 @@ class TelegramBot:
         Args:
             timeout: Maximum time to wait in seconds.
         """
-        import time as _time
+        if TelegramBot._loop is None or TelegramBot._loop.is_closed():
+            return
 
-        start = _time.time()
-        while _time.time() - start < timeout:
-            if self._direct_queue.empty() and self._channel_queue.empty():
-                return
-            _time.sleep(0.1)
+        future = asyncio.run_coroutine_threadsafe(self._drain(), TelegramBot._loop)
+        try:
+            future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+
+    def shutdown(self, wait: bool = False) -> None:
+        """
+        Shutdown the bot and cleanup resources.
+
+        The background event loop stops and closes itself on its daemon
+        thread, so by default this returns without waiting for it.
 
-    def shutdown(self) -> None:
-        """Shutdown the bot and cleanup resources."""
-        TelegramBot._stop_flag = True
+        Args:
+            wait: Block until the event loop thread has finished (up to 5s).
+        """
         self.stop_receiving()
 
-        if TelegramBot._worker_thread is not None and TelegramBot._worker_thread.is_alive():
-            TelegramBot._worker_thread.join(timeout=5.0)
+        if TelegramBot._loop is not None and not TelegramBot._loop.is_closed():
+            TelegramBot._loop.call_soon_threadsafe(TelegramBot._stop_event.set)
+
+        runner_thread = TelegramBot._runner_thread
+        if wait and runner_thread is not None and runner_thread.is_alive():
+            runner_thread.join(timeout=5.0)
 
-        if TelegramBot._loop is not None:
-            if TelegramBot._loop.is_running():
-                TelegramBot._loop.stop()
-            if not TelegramBot._loop.is_closed():
-                TelegramBot._loop.close()
+        for name in (*_FAST_PATH_METHODS, "initialize"):
+            vars(self).pop(name, None)
 
         TelegramBot._initialized = False
 
     # Private methods
 
-    async def _send_message(self, message: str, chat_id: int | str | None = None) -> None:
-        """Send a message asynchronously."""
-        if TelegramBot._bot is None or TelegramBot._settings is None:
-            return
+    def _skip_initialize(
+        self,
+        settings: Settings | None = None,
+        env_path: str | Path | None = None,
+    ) -> None:
+        """Stand-in for initialize() while the bot is already initialized."""
+
+    def _warn_if_no_handlers(self) -> None:
+        """Warn once if messages are sent before any handler is registered."""
+        if not TelegramBot._warned_no_handlers and not TelegramBot._handler_registry:
+            TelegramBot._warned_no_handlers = True
+            logger.warning(CONSTANTS.LOG_NO_HANDLERS_WARNING)
+
+    async def _send_message(
+        self, message: str, chat_id: int | str | None = None
+    ) -> Exception | None:
+        """
+        Send a message asynchronously, capped at MAX_CONCURRENT_SENDS in flight.
+
+        Returns:
+            None if the message was sent, otherwise the error, which has
+            already been logged.
+        """
+        if (
+            TelegramBot._bot is None
+            or TelegramBot._settings is None
+            or TelegramBot._send_semaphore is None
+        ):
+            return NotInitializedError(CONSTANTS.ERR_NOT_INITIALIZED)
 
         try:
             target = chat_id if chat_id is not None else TelegramBot._settings.normalized_channel_id
-            await TelegramBot._bot.send_message(
-                chat_id=target,
-                text=message,
-                parse_mode=TelegramBot._settings.parse_mode,
-            )
+            async with TelegramBot._send_semaphore:
+                await TelegramBot._bot.send_message(
+                    chat_id=target,
+                    text=message,
+                    parse_mode=TelegramBot._settings.parse_mode,
+                )
         except Exception as e:
-            print(CONSTANTS.ERR_SEND_FAILED.format(error=str(e)))
+            logger.exception(CONSTANTS.ERR_SEND_FAILED, e)
+            return e
+        return None
 
-    def _message_worker(self) -> None:
-        """Background worker that processes messages from the queues."""
-        TelegramBot._loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(TelegramBot._loop)
+    def _enqueue(self, priority: int, message: str, chat_id: int | None = None) -> None:
+        """Hand a message to the event loop thread's send queue."""
+        if TelegramBot._loop is None:
+            raise NotInitializedError(CONSTANTS.ERR_NOT_INITIALIZED)
 
-        while not TelegramBot._stop_flag:
-            try:
-                # Process direct messages first (higher priority)
-                try:
-                    message, chat_id = TelegramBot._direct_queue.get_nowait()
-                    TelegramBot._loop.run_until_complete(self._send_message(message, chat_id))
-                except Exception:
-                    # No direct messages, try channel messages
-                    try:
-                        message = TelegramBot._channel_queue.get(timeout=1.0)
-                        TelegramBot._loop.run_until_complete(self._send_message(message))
-                    except Exception:
-                        continue
-
-                # Small delay to prevent too rapid sending
+        item = (priority, next(TelegramBot._sequence), message, chat_id)
+        TelegramBot._loop.call_soon_threadsafe(TelegramBot._send_queue.put_nowait, item)
+
+    async def _drain(self) -> None:
+        """Wait until every queued message has been sent."""
+        await TelegramBot._send_queue.join()
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> asyncio.Task[None]:
+        """Start a background task and keep a reference until it finishes."""
+        task = asyncio.create_task(coro)
+        TelegramBot._background_tasks.add(task)
+        task.add_done_callback(TelegramBot._background_tasks.discard)
+        return task
+
+    def _run_loop(self, runner: asyncio.Runner) -> None:
+        """Run the shared event loop until shutdown."""
+        with runner:
+            runner.run(self._main())
+
+    async def _main(self) -> None:
+        """Run the sender until shutdown is requested."""
+        self._spawn(self._sender_task())
+        await TelegramBot._stop_event.wait()
+        # Leaving the runner cancels the sender, polling and any in-flight tasks
+
+    async def _sender_task(self) -> None:
+        """
+        Send queued messages until cancelled at shutdown.
+
+        Sends are scheduled as tasks so several chats can be sent to at once,
+        while each chat has at most one send in flight so its messages arrive
+        in order. send_delay paces how quickly new sends are started, and also
+        separates consecutive sends to the same chat. Channel messages that
+        pile up during that delay are coalesced into a single send.
+        """
+        queue = TelegramBot._send_queue
+        while True:
+            # Direct messages sort ahead of channel messages
+            priority, _, message, chat_id = await queue.get()
+
+            parts = [message]
+            if priority == _PRIORITY_CHANNEL:
+                parts = self._coalesce(queue, message)
+
+            previous = TelegramBot._chat_sends.get(chat_id)
+            task = self._spawn(self._send_after(previous, parts, chat_id))
+            TelegramBot._chat_sends[chat_id] = task
+            task.add_done_callback(partial(self._mark_done, queue, len(parts)))
+
+            # Small delay to prevent too rapid sending
+            if TelegramBot._settings:
+                await asyncio.sleep(TelegramBot._settings.send_delay)
+
+    async def _send_after(
+        self, previous: asyncio.Task[None] | None, parts: list[str], chat_id: int | None
+    ) -> None:
+        """
+        Send ``parts`` as one message once the previous send to the same chat has finished.
+
+        If Telegram rejects a coalesced message as a bad request, e.g. because
+        one part has invalid markup, its parts are retried one by one, paced by
+        send_delay, so only the bad part is lost. Other errors such as flood
+        control or timeouts are not retried: that would add load or risk
+        duplicating a message that was in fact delivered.
+        """
+        try:
+            if previous is not None:
+                await asyncio.wait((previous,))
+                # Keep send_delay between sends to one chat, even after a slow send
                 if TelegramBot._settings:
-                    time.sleep(TelegramBot._settings.send_delay)
+                    await asyncio.sleep(TelegramBot._settings.send_delay)
+            error = await self._send_message("\n".join(parts), chat_id)
+            if isinstance(error, BadRequest) and len(parts) > 1:
+                logger.warning(CONSTANTS.LOG_COALESCED_SEND_FAILED, len(parts))
+                for part in parts:
+                    if TelegramBot._settings:
+                        await asyncio.sleep(TelegramBot._settings.send_delay)
+                    await self._send_message(part, chat_id)
+        finally:
+            if TelegramBot._chat_sends.get(chat_id) is asyncio.current_task():
+                del TelegramBot._chat_sends[chat_id]
+
+    def _coalesce(self, queue: asyncio.PriorityQueue[_QueueItem], message: str) -> list[str]:
+        """
+        Collect channel messages already queued behind ``message`` for one send.
 
-            except Exception as e:
-                print(CONSTANTS.ERR_WORKER_FAILED.format(error=str(e)))
+        Stops at the first non-channel item or when the newline-joined text
+        would exceed Telegram's message length limit.
 
-        # Cleanup event loop
-        if TelegramBot._loop is not None:
-            if TelegramBot._loop.is_running():
-                TelegramBot._loop.stop()
-            if not TelegramBot._loop.is_closed():
-                TelegramBot._loop.close()
+        Returns:
+            ``message`` followed by the queued messages it was joined with.
+        """
+        parts = [message]
+        length = len(message)
+        while not queue.empty():
+            item = queue.get_nowait()
+            next_message = item[2]
+            if (
+                item[0] != _PRIORITY_CHANNEL
+                or length + 1 + len(next_message) > CONSTANTS.MAX_MESSAGE_LENGTH
+            ):
+                # Put it back; its sequence number keeps its place in line
+                queue.put_nowait(item)
+                queue.task_done()
+                break
+            parts.append(next_message)
+            length += 1 + len(next_message)
+        return parts
+
+    def _mark_done(
+        self, queue: asyncio.PriorityQueue[_QueueItem], count: int, task: asyncio.Task[None]
+    ) -> None:
+        """Mark ``count`` queue items as processed once their send task finishes."""
+        for _ in range(count):
+            queue.task_done()
 
     async def _handle_update(self, update: Update) -> None:
         """Handle an incoming update from Telegram."""
         if update.message:
-            # Filter by allowed user IDs
-            if TelegramBot._settings and TelegramBot._settings.allowed_user_ids:
+            # Filter by allowed user IDs (frozenset, O(1) lookup)
+            settings = TelegramBot._settings
+            if settings is not None and settings.allowed_user_ids:
                 user = update.message.from_user
-                if user and user.id not in TelegramBot._settings.allowed_user_ids:
+                if user and user.id not in settings.allowed_user_ids:
                     return  # Silently ignore unauthorized users
 
-            for handler in TelegramBot._handler_registry.handlers:
-                try:
-                    handler(update)
-                except Exception as e:
-                    print(CONSTANTS.ERR_HANDLER_FAILED.format(error=str(e)))
+            # Run all handlers concurrently so a slow one doesn't hold up the rest
+            results = await asyncio.gather(
+                *(
+                    self._run_handler(handler, update)
+                    for handler in TelegramBot._handler_registry.handlers
+                ),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(CONSTANTS.ERR_HANDLER_FAILED, result, exc_info=result)
+
+    async def _run_handler(self, handler: MessageHandler, update: Update) -> None:
+        """
+        Run coroutine handlers on the loop and other handlers in the default executor.
+
+        Any awaitable returned from the executor, such as the coroutine of an
+        object with an ``async def __call__``, is then awaited on the loop.
+        """
+        if inspect.iscoroutinefunction(handler):
+            await cast(Awaitable[None], handler(update))
+            return
+        result = await asyncio.get_running_loop().run_in_executor(None, handler, update)
+        if inspect.isawaitable(result):
+            await result
 
     async def _poll_updates(self) -> None:
-        """Continuously poll for updates from Telegram."""
+        """
+        Continuously poll for updates from Telegram.
+
+        If offset_store_path is configured, the offset is resumed from it on
+        start and saved after each poll. The saved offset never moves past an
+        update whose handlers haven't finished, so updates still queued at a
+        crash or shutdown are delivered again after a restart (at least once).
+        """
         if TelegramBot._bot is None or TelegramBot._settings is None:
             return
 
-        offset: int | None = None
-        while not TelegramBot._stop_flag and TelegramBot._is_polling:
+        offset_store = TelegramBot._settings.offset_store_path
+        offset = self._load_offset(offset_store) if offset_store else None
+        saved_offset = offset
+        while True:
             try:
                 updates = await TelegramBot._bot.get_updates(
                     offset=offset, timeout=TelegramBot._settings.poll_timeout
                 )
                 for update in updates:
-                    await self._handle_update(update)
+                    self._dispatch_update(update)
                     offset = update.update_id + 1
+                if offset_store and offset is not None:
+                    # Resume from the oldest update that is still being handled
+                    pending = TelegramBot._pending_updates
+                    handled_offset = min(pending) if pending else offset
+                    if handled_offset != saved_offset:
+                        await asyncio.to_thread(self._save_offset, offset_store, handled_offset)
+                        saved_offset = handled_offset
             except Exception as e:
-                print(CONSTANTS.ERR_POLLING_FAILED.format(error=str(e)))
+                logger.exception(CONSTANTS.ERR_POLLING_FAILED, e)
                 await asyncio.sleep(TelegramBot._settings.retry_delay)
 
-    def _start_polling(self) -> None:
-        """Start the polling loop in a background thread."""
-        polling_loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(polling_loop)
-        polling_loop.run_until_complete(self._poll_updates())
+    def _load_offset(self, path: str) -> int | None:
+        """Read a previously saved update offset, if there is a valid one."""
+        try:
+            return int(Path(path).read_text().strip())
+        except (OSError, ValueError):
+            return None
+
+    def _save_offset(self, path: str, offset: int) -> None:
+        """
+        Persist the next update offset.
+
+        The offset is written to a temporary file that then replaces the
+        store, so a crash mid-write never leaves a truncated offset behind.
+        """
+        target = Path(path)
+        temp = target.with_name(f"{target.name}.tmp")
+        try:
+            with temp.open("w") as f:
+                f.write(str(offset))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp, target)
+        except OSError as e:
+            logger.exception(CONSTANTS.ERR_OFFSET_STORE_FAILED, e)
+
+    def _dispatch_update(self, update: Update) -> None:
+        """Queue an update on its chat's worker, starting one if needed."""
+        chat = update.effective_chat
+        chat_id = chat.id if chat else 0
+        queue = TelegramBot._chat_workers.get(chat_id)
+        if queue is None:
+            queue = asyncio.Queue()
+            TelegramBot._chat_workers[chat_id] = queue
+            self._spawn(self._chat_worker(chat_id, queue))
+        TelegramBot._pending_updates.add(update.update_id)
+        queue.put_nowait(update)
+
+    async def _chat_worker(self, chat_id: int, queue: asyncio.Queue[Update]) -> None:
+        """
+        Handle one chat's updates in order, exiting once the chat goes idle.
+
+        Updates for different chats are handled concurrently by separate
+        workers, so a slow chat doesn't delay the others.
+        """
+        try:
+            while True:
+                try:
+                    update = await asyncio.wait_for(
+                        queue.get(), timeout=CONSTANTS.CHAT_WORKER_IDLE_TIMEOUT
+                    )
+                except TimeoutError:
+                    if queue.empty():
+                        return
+                    continue
+                try:
+                    await self._handle_update(update)
+                finally:
+                    TelegramBot._pending_updates.discard(update.update_id)
+                    queue.task_done()
+        finally:
+            if TelegramBot._chat_workers.get(chat_id) is queue:
+                del TelegramBot._chat_workers[chat_id]
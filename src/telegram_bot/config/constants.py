@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Constants:
     """Immutable constants for the Telegram bot library."""
 
@@ -16,6 +16,7 @@ class Constants:
     ENV_RETRY_DELAY: str = "TELEGRAM_RETRY_DELAY"
     ENV_SEND_DELAY: str = "TELEGRAM_SEND_DELAY"
     ENV_ALLOWED_USER_IDS: str = "TELEGRAM_ALLOWED_USER_IDS"
+    ENV_OFFSET_STORE_PATH: str = "TELEGRAM_OFFSET_STORE_PATH"
 
     # Default values
     DEFAULT_PARSE_MODE: str = "HTML"
@@ -23,25 +24,30 @@ class Constants:
     DEFAULT_RETRY_DELAY: float = 5.0
     DEFAULT_SEND_DELAY: float = 0.1
     DEFAULT_BASE_URL: str = ""
+    MAX_CONCURRENT_SENDS: int = 8
+    CHAT_WORKER_IDLE_TIMEOUT: float = 60.0
+    CONNECTION_POOL_SIZE: int = 32
+    MAX_MESSAGE_LENGTH: int = 4096
 
     # Log messages
     LOG_STARTED_RECEIVING: str = "Started receiving messages"
     LOG_STOPPED_RECEIVING: str = "Stopped receiving messages"
     LOG_NO_HANDLERS_WARNING: str = (
-        "Warning: No message handlers registered. Use add_message_handler() to receive messages."
+        "No message handlers registered. Use add_message_handler() to receive messages."
     )
-    LOG_NO_HANDLERS_START: str = (
-        "Warning: No message handlers registered. Use add_message_handler() first."
+    LOG_NO_HANDLERS_START: str = "No message handlers registered. Use add_message_handler() first."
+    LOG_COALESCED_SEND_FAILED: str = (
+        "Coalesced send of %s messages was rejected, sending them one by one"
     )
 
     # Error messages
     ERR_NOT_INITIALIZED: str = "TelegramBot is not initialized. Call initialize() first."
     ERR_MISSING_BOT_TOKEN: str = "Bot token is required"
     ERR_MISSING_CHANNEL_ID: str = "Channel ID is required"
-    ERR_HANDLER_FAILED: str = "Error in message handler: {error}"
-    ERR_POLLING_FAILED: str = "Error polling updates: {error}"
-    ERR_SEND_FAILED: str = "Error sending message: {error}"
-    ERR_WORKER_FAILED: str = "Worker thread error: {error}"
+    ERR_HANDLER_FAILED: str = "Error in message handler: %s"
+    ERR_POLLING_FAILED: str = "Error polling updates: %s"
+    ERR_SEND_FAILED: str = "Error sending message: %s"
+    ERR_OFFSET_STORE_FAILED: str = "Error saving update offset: %s"
     ERR_INVALID_SETTINGS: str = "Invalid settings: {error}"
 
 
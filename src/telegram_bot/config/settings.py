@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -15,9 +16,15 @@ if TYPE_CHECKING:
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Settings:
-    """Immutable settings for the Telegram bot."""
+    """
+    Immutable settings for the Telegram bot.
+
+    allowed_user_ids is always stored as a frozenset. For compatibility the
+    constructor also accepts any other set or iterable of IDs, or None, and
+    converts it.
+    """
 
     bot_token: str
     channel_id: str
@@ -26,27 +33,42 @@ class Settings:
     poll_timeout: int = CONSTANTS.DEFAULT_POLL_TIMEOUT
     retry_delay: float = CONSTANTS.DEFAULT_RETRY_DELAY
     send_delay: float = CONSTANTS.DEFAULT_SEND_DELAY
-    allowed_user_ids: set[int] | None = None  # None = allow all users
+    allowed_user_ids: frozenset[int] = frozenset()  # empty = allow all users
+    offset_store_path: str | None = None  # None = don't persist the update offset
+
+    # Derived values, computed once in __post_init__
+    normalized_channel_id: str = field(init=False, repr=False, compare=False)
+    base_url_prefix: str = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        """Validate settings after initialization."""
+        """Validate settings and precompute derived values."""
         if not self.bot_token:
             raise ValueError(CONSTANTS.ERR_MISSING_BOT_TOKEN)
         if not self.channel_id:
             raise ValueError(CONSTANTS.ERR_MISSING_CHANNEL_ID)
 
-    @property
-    def normalized_channel_id(self) -> str:
-        """Return channel ID with @ prefix if needed."""
+        # Accept any iterable of IDs (or None) for O(1) hashed lookups
+        object.__setattr__(self, "allowed_user_ids", frozenset(self.allowed_user_ids or ()))
+
+        # Channel ID with @ prefix if needed
         if self.channel_id.startswith("@") or self.channel_id.startswith("-100"):
-            return self.channel_id
-        return f"@{self.channel_id}"
+            normalized_channel_id = self.channel_id
+        else:
+            normalized_channel_id = f"@{self.channel_id}"
+        object.__setattr__(self, "normalized_channel_id", normalized_channel_id)
 
+        # Base URL without trailing slash, ready for path joining
+        object.__setattr__(self, "base_url_prefix", self.base_url.rstrip("/"))
 
+
+@cache
 def get_settings(env_path: str | Path | None = None) -> Settings:
     """
     Load settings from environment variables.
 
+    Results are cached per env_path, so the .env file and environment are
+    only read on the first call. Use get_settings.cache_clear() to reload.
+
     Args:
         env_path: Optional path to .env file. If None, uses default .env loading.
 
@@ -75,12 +97,12 @@ def get_settings(env_path: str | Path | None = None) -> Settings:
     send_delay_str = os.getenv(CONSTANTS.ENV_SEND_DELAY, "")
     send_delay = float(send_delay_str) if send_delay_str else CONSTANTS.DEFAULT_SEND_DELAY
 
+    offset_store_path = os.getenv(CONSTANTS.ENV_OFFSET_STORE_PATH) or None
+
     allowed_user_ids_str = os.getenv(CONSTANTS.ENV_ALLOWED_USER_IDS, "")
-    allowed_user_ids: set[int] | None = None
-    if allowed_user_ids_str.strip():
-        allowed_user_ids = {
-            int(uid.strip()) for uid in allowed_user_ids_str.split(",") if uid.strip()
-        }
+    allowed_user_ids = frozenset(
+        int(uid.strip()) for uid in allowed_user_ids_str.split(",") if uid.strip()
+    )
 
     return Settings(
         bot_token=bot_token,
@@ -91,4 +113,5 @@ def get_settings(env_path: str | Path | None = None) -> Settings:
         retry_delay=retry_delay,
         send_delay=send_delay,
         allowed_user_ids=allowed_user_ids,
+        offset_store_path=offset_store_path,
     )
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Awaitable
+from contextlib import suppress
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Protocol
 
@@ -10,9 +12,13 @@ if TYPE_CHECKING:
 
 
 class MessageHandler(Protocol):
-    """Protocol for message handler functions."""
+    """
+    Protocol for message handler functions.
 
-    def __call__(self, update: Update) -> None:
+    Handlers may be plain functions or ``async def`` coroutine functions.
+    """
+
+    def __call__(self, update: Update) -> None | Awaitable[None]:
         """
         Handle an incoming Telegram update.
 
@@ -24,9 +30,18 @@ class MessageHandler(Protocol):
 
 @dataclass
 class HandlerRegistry:
-    """Registry for managing message handlers."""
+    """
+    Registry for managing message handlers.
+
+    Handlers are stored in an immutable tuple that is replaced on every
+    change, so readers can iterate a snapshot without copying or locking.
+    A parallel set gives O(1) duplicate and membership checks; unhashable
+    handlers, such as callable dataclasses, are only kept in the tuple and
+    found by scanning it.
+    """
 
-    _handlers: list[MessageHandler] = field(default_factory=list)
+    _handlers: tuple[MessageHandler, ...] = ()
+    _handler_set: set[MessageHandler] = field(default_factory=set, repr=False)
 
     def add(self, handler: MessageHandler) -> None:
         """
@@ -35,8 +50,10 @@ class HandlerRegistry:
         Args:
             handler: A callable that accepts a telegram.Update object.
         """
-        if handler not in self._handlers:
-            self._handlers.append(handler)
+        if handler not in self:
+            with suppress(TypeError):
+                self._handler_set.add(handler)
+            self._handlers = (*self._handlers, handler)
 
     def remove(self, handler: MessageHandler) -> bool:
         """
@@ -48,24 +65,35 @@ class HandlerRegistry:
         Returns:
             True if the handler was removed, False if it wasn't found.
         """
-        if handler in self._handlers:
-            self._handlers.remove(handler)
+        if handler in self:
+            with suppress(TypeError):
+                self._handler_set.discard(handler)
+            index = self._handlers.index(handler)
+            self._handlers = self._handlers[:index] + self._handlers[index + 1 :]
             return True
         return False
 
     def clear(self) -> None:
         """Remove all handlers from the registry."""
-        self._handlers.clear()
+        self._handlers = ()
+        self._handler_set.clear()
 
     @property
-    def handlers(self) -> list[MessageHandler]:
-        """Return a copy of the handlers list."""
-        return list(self._handlers)
+    def handlers(self) -> tuple[MessageHandler, ...]:
+        """Return an immutable snapshot of the registered handlers."""
+        return self._handlers
 
     def __len__(self) -> int:
         """Return the number of registered handlers."""
         return len(self._handlers)
 
+    def __contains__(self, handler: object) -> bool:
+        """Return True if the handler is registered."""
+        try:
+            return handler in self._handler_set
+        except TypeError:
+            return handler in self._handlers
+
     def __bool__(self) -> bool:
         """Return True if there are any registered handlers."""
         return len(self._handlers) > 0
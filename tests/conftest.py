@@ -1,8 +1,23 @@
 """Pytest fixtures for telegram-bot tests."""
 
+from collections.abc import Iterator
+
 import pytest
 
-from telegram_bot import Settings, TelegramBot
+from telegram_bot import Settings, TelegramBot, get_settings
+
+# Cached functions whose results must not leak between tests
+CACHED_FUNCTIONS = [get_settings]
+
+
+@pytest.fixture(autouse=True)
+def clear_functools_caches() -> Iterator[None]:
+    """Clear registered functools caches before and after each test."""
+    for cached in CACHED_FUNCTIONS:
+        cached.cache_clear()
+    yield
+    for cached in CACHED_FUNCTIONS:
+        cached.cache_clear()
 
 
 @pytest.fixture
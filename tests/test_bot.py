@@ -1,10 +1,17 @@
 """Tests for the TelegramBot class."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import time
+from collections.abc import Iterator
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from telegram import Update
+from telegram.error import BadRequest, RetryAfter
 
-from telegram_bot import NotInitializedError, Settings, TelegramBot
+from telegram_bot import CONSTANTS, NotInitializedError, Settings, TelegramBot
 
 
 class TestTelegramBotSingleton:
@@ -67,68 +74,221 @@ class TestTelegramBotInitialization:
         with pytest.raises(NotInitializedError):
             bot.send_message_sync("test")
 
+    def test_not_initialized_error_after_shutdown(
+        self, reset_bot: None, mock_settings: Settings
+    ) -> None:
+        """Test that send methods check initialization again after shutdown."""
+        with patch("telegram_bot.bot.telegram.Bot"):
+            bot = TelegramBot.get_instance()
+            bot.initialize(settings=mock_settings)
+            bot.shutdown()
+
+            with pytest.raises(NotInitializedError):
+                bot.send_message_sync("test")
+
 
 class TestTelegramBotMessaging:
     """Tests for message sending."""
 
+    @pytest.fixture(autouse=True)
+    def send_mock(self) -> Iterator[AsyncMock]:
+        """Capture messages handed to the sender instead of calling Telegram."""
+        with patch.object(TelegramBot, "_send_message", new_callable=AsyncMock) as mock:
+            yield mock
+
+    @pytest.fixture
+    def first_sent_bot(
+        self, reset_bot: None, mock_settings: Settings, send_mock: AsyncMock
+    ) -> Iterator[TelegramBot]:
+        """
+        Start a bot whose sender has just sent "first" and is waiting out send_delay.
+
+        Messages the test queues next pile up behind it until the delay ends.
+        """
+        with patch("telegram_bot.bot.telegram.Bot"):
+            bot = TelegramBot.get_instance()
+            bot.initialize(settings=replace(mock_settings, send_delay=0.3))
+
+            bot.add_message_handler(Mock())
+
+            bot.send_message_sync("first")
+            deadline = time.monotonic() + 2.0
+            while not send_mock.await_count:
+                if time.monotonic() > deadline:
+                    pytest.fail("Sender did not send the first message within 2s")
+                time.sleep(0.01)
+            yield bot
+
     def test_send_message_sync_queues_message(
-        self, reset_bot: None, mock_settings: Settings
+        self, reset_bot: None, mock_settings: Settings, send_mock: AsyncMock
     ) -> None:
-        """Test that send_message_sync adds message to queue."""
+        """Test that send_message_sync delivers the message to the channel."""
         with patch("telegram_bot.bot.telegram.Bot"):
             bot = TelegramBot.get_instance()
             bot.initialize(settings=mock_settings)
 
             # Add a dummy handler to avoid warning
-            bot.add_message_handler(MagicMock())
-
-            # Clear the queue before test
-            while not TelegramBot._channel_queue.empty():
-                TelegramBot._channel_queue.get_nowait()
+            bot.add_message_handler(Mock())
 
             bot.send_message_sync("test message")
+            bot.flush()
 
-            assert not TelegramBot._channel_queue.empty()
-            msg = TelegramBot._channel_queue.get_nowait()
-            assert msg == "test message"
+            send_mock.assert_awaited_once_with("test message", None)
 
     def test_reply_to_user_queues_message(
-        self, reset_bot: None, mock_settings: Settings
+        self, reset_bot: None, mock_settings: Settings, send_mock: AsyncMock
     ) -> None:
-        """Test that reply_to_user adds message to direct queue."""
+        """Test that reply_to_user delivers the message to the given chat."""
         with patch("telegram_bot.bot.telegram.Bot"):
             bot = TelegramBot.get_instance()
             bot.initialize(settings=mock_settings)
 
-            bot.add_message_handler(MagicMock())
-
-            while not TelegramBot._direct_queue.empty():
-                TelegramBot._direct_queue.get_nowait()
+            bot.add_message_handler(Mock())
 
             bot.reply_to_user("direct message", chat_id=12345)
+            bot.flush()
 
-            assert not TelegramBot._direct_queue.empty()
-            msg, chat_id = TelegramBot._direct_queue.get_nowait()
-            assert msg == "direct message"
-            assert chat_id == 12345
+            send_mock.assert_awaited_once_with("direct message", 12345)
 
     def test_send_url_sync_constructs_url(
-        self, reset_bot: None, mock_settings: Settings
+        self, reset_bot: None, mock_settings: Settings, send_mock: AsyncMock
     ) -> None:
         """Test that send_url_sync constructs full URL."""
         with patch("telegram_bot.bot.telegram.Bot"):
             bot = TelegramBot.get_instance()
             bot.initialize(settings=mock_settings)
 
-            bot.add_message_handler(MagicMock())
+            bot.add_message_handler(Mock())
 
-            while not TelegramBot._channel_queue.empty():
-                TelegramBot._channel_queue.get_nowait()
+            bot.send_url_sync("/test/path")
+            bot.flush()
+
+            send_mock.assert_awaited_once_with("https://example.com/test/path", None)
+
+    def test_send_url_sync_without_base_url(
+        self, reset_bot: None, mock_settings: Settings, send_mock: AsyncMock
+    ) -> None:
+        """Test that send_url_sync sends only the path when no base URL is set."""
+        with patch("telegram_bot.bot.telegram.Bot"):
+            bot = TelegramBot.get_instance()
+            bot.initialize(settings=replace(mock_settings, base_url=""))
+
+            bot.add_message_handler(Mock())
 
             bot.send_url_sync("/test/path")
+            bot.flush()
+
+            send_mock.assert_awaited_once_with("test/path", None)
+
+    def test_direct_messages_sent_before_channel_messages(
+        self, first_sent_bot: TelegramBot, send_mock: AsyncMock
+    ) -> None:
+        """Test that queued direct messages take priority over channel messages."""
+        first_sent_bot.send_message_sync("second")
+        first_sent_bot.reply_to_user("direct", chat_id=12345)
+        first_sent_bot.flush()
+
+        assert [c.args for c in send_mock.await_args_list] == [
+            ("first", None),
+            ("direct", 12345),
+            ("second", None),
+        ]
+
+    def test_messages_to_one_chat_delivered_in_order(
+        self, reset_bot: None, mock_settings: Settings, send_mock: AsyncMock
+    ) -> None:
+        """Test that a slow send doesn't let later messages to the same chat overtake it."""
+        latencies = {"step 1": 0.3, "step 2": 0.01, "step 3": 0.01, "other chat": 0.01}
+        delivered: list[str] = []
+        started: dict[str, float] = {}
+        finished: dict[str, float] = {}
+
+        async def send(message: str, chat_id: int | None) -> None:
+            started[message] = time.monotonic()
+            await asyncio.sleep(latencies[message])
+            finished[message] = time.monotonic()
+            delivered.append(message)
+
+        send_mock.side_effect = send
+        with patch("telegram_bot.bot.telegram.Bot"):
+            bot = TelegramBot.get_instance()
+            bot.initialize(settings=mock_settings)
+
+            bot.add_message_handler(Mock())
+
+            bot.reply_to_user("step 1", chat_id=1)
+            bot.reply_to_user("step 2", chat_id=1)
+            bot.reply_to_user("other chat", chat_id=2)
+            bot.reply_to_user("step 3", chat_id=1)
+            bot.flush()
+
+            # Other chats still overlap with the slow send
+            assert delivered == ["other chat", "step 1", "step 2", "step 3"]
+            # Sends queued behind the slow one still keep send_delay apart
+            send_delay = mock_settings.send_delay
+            assert started["step 2"] - finished["step 1"] >= send_delay * 0.9
+            assert started["step 3"] - finished["step 2"] >= send_delay * 0.9
 
-            msg = TelegramBot._channel_queue.get_nowait()
-            assert msg == "https://example.com/test/path"
+    def test_queued_channel_messages_are_coalesced(
+        self, first_sent_bot: TelegramBot, send_mock: AsyncMock
+    ) -> None:
+        """Test that channel messages queued during send_delay are sent together."""
+        first_sent_bot.send_message_sync("second")
+        first_sent_bot.send_message_sync("third")
+        first_sent_bot.flush()
+
+        assert [c.args for c in send_mock.await_args_list] == [
+            ("first", None),
+            ("second\nthird", None),
+        ]
+
+    def test_failed_coalesced_send_falls_back_to_single_sends(
+        self, first_sent_bot: TelegramBot, send_mock: AsyncMock
+    ) -> None:
+        """Test that one bad message doesn't drop the others it was coalesced with."""
+        send_mock.side_effect = lambda message, chat_id: (
+            BadRequest("Can't parse entities") if "<bad" in message else None
+        )
+        first_sent_bot.send_message_sync("second")
+        first_sent_bot.send_message_sync("<bad")
+        first_sent_bot.flush()
+
+        assert [c.args for c in send_mock.await_args_list] == [
+            ("first", None),
+            ("second\n<bad", None),
+            ("second", None),
+            ("<bad", None),
+        ]
+
+    # RetryAfter's constructor trips PTB's own retry_after deprecation warning
+    @pytest.mark.filterwarnings("ignore::telegram.warnings.PTBDeprecationWarning")
+    def test_failed_coalesced_send_not_retried_on_flood_control(
+        self, first_sent_bot: TelegramBot, send_mock: AsyncMock
+    ) -> None:
+        """Test that a rate-limited coalesced send isn't fanned out into more sends."""
+        send_mock.side_effect = lambda message, chat_id: (
+            RetryAfter(5) if "\n" in message else None
+        )
+        first_sent_bot.send_message_sync("second")
+        first_sent_bot.send_message_sync("third")
+        first_sent_bot.flush()
+
+        assert [c.args for c in send_mock.await_args_list] == [
+            ("first", None),
+            ("second\nthird", None),
+        ]
+
+    def test_coalescing_respects_message_length_limit(
+        self, first_sent_bot: TelegramBot, send_mock: AsyncMock
+    ) -> None:
+        """Test that coalescing never builds a message over Telegram's limit."""
+        long_message = "x" * (CONSTANTS.MAX_MESSAGE_LENGTH // 2)
+        for _ in range(3):
+            first_sent_bot.send_message_sync(long_message)
+        first_sent_bot.flush()
+
+        sent = [c.args[0] for c in send_mock.await_args_list]
+        assert sent[1:] == [long_message, long_message, long_message]
 
 
 class TestTelegramBotHandlers:
@@ -142,7 +302,7 @@ class TestTelegramBotHandlers:
             bot = TelegramBot.get_instance()
             bot.initialize(settings=mock_settings)
 
-            handler = MagicMock()
+            handler = Mock()
             bot.add_message_handler(handler)
 
             assert len(TelegramBot._handler_registry) == 1
@@ -155,7 +315,7 @@ class TestTelegramBotHandlers:
             bot = TelegramBot.get_instance()
             bot.initialize(settings=mock_settings)
 
-            handler = MagicMock()
+            handler = Mock()
             bot.add_message_handler(handler)
             result = bot.remove_message_handler(handler)
 
@@ -170,8 +330,115 @@ class TestTelegramBotHandlers:
             bot = TelegramBot.get_instance()
             bot.initialize(settings=mock_settings)
 
-            bot.add_message_handler(MagicMock())
-            bot.add_message_handler(MagicMock())
+            bot.add_message_handler(Mock())
+            bot.add_message_handler(Mock())
             bot.clear_handlers()
 
             assert len(TelegramBot._handler_registry) == 0
+
+    async def test_handle_update_runs_sync_and_async_handlers(self, reset_bot: None) -> None:
+        """Test that sync and async handlers all receive the update."""
+        bot = TelegramBot.get_instance()
+        update = Mock()
+        sync_handler = Mock()
+        async_handler = AsyncMock()
+        TelegramBot._handler_registry.add(sync_handler)
+        TelegramBot._handler_registry.add(async_handler)
+
+        await bot._handle_update(update)
+
+        sync_handler.assert_called_once_with(update)
+        async_handler.assert_awaited_once_with(update)
+
+    async def test_handle_update_awaits_awaitables_from_other_callables(
+        self, reset_bot: None
+    ) -> None:
+        """Test that callables returning awaitables are awaited, not dropped."""
+        bot = TelegramBot.get_instance()
+        update = Mock()
+        hits: list[str] = []
+
+        class AsyncCallable:
+            async def __call__(self, update: Update) -> None:
+                hits.append("object")
+
+        async def record(update: Update) -> None:
+            hits.append("lambda")
+
+        TelegramBot._handler_registry.add(AsyncCallable())
+        TelegramBot._handler_registry.add(lambda update: record(update))
+
+        await bot._handle_update(update)
+
+        assert sorted(hits) == ["lambda", "object"]
+
+    async def test_handle_update_isolates_failing_handler(self, reset_bot: None) -> None:
+        """Test that a failing handler doesn't prevent others from running."""
+        bot = TelegramBot.get_instance()
+        update = Mock()
+        handler = Mock()
+        TelegramBot._handler_registry.add(Mock(side_effect=RuntimeError("boom")))
+        TelegramBot._handler_registry.add(handler)
+
+        await bot._handle_update(update)
+
+        handler.assert_called_once_with(update)
+
+    async def test_dispatch_update_preserves_per_chat_order(self, reset_bot: None) -> None:
+        """Test that updates for one chat are handled in arrival order."""
+        bot = TelegramBot.get_instance()
+        handled: list[int] = []
+
+        async def handler(update: Update) -> None:
+            await asyncio.sleep(0.01 if update.update_id == 1 else 0)
+            handled.append(update.update_id)
+
+        TelegramBot._handler_registry.add(handler)
+        for update_id in (1, 2, 3):
+            update = Mock(update_id=update_id)
+            update.effective_chat.id = 42
+            bot._dispatch_update(update)
+
+        await TelegramBot._chat_workers[42].join()
+
+        assert handled == [1, 2, 3]
+
+
+class TestTelegramBotPolling:
+    """Tests for update polling."""
+
+    async def test_poll_updates_persists_offset(
+        self, reset_bot: None, mock_settings: Settings, tmp_path: Path
+    ) -> None:
+        """Test that polling resumes from the stored offset and only saves handled updates."""
+        offset_file = tmp_path / "offset.txt"
+        offset_file.write_text("5")
+        TelegramBot._settings = replace(mock_settings, offset_store_path=str(offset_file))
+        release = asyncio.Event()
+        saved: list[str] = []
+
+        async def handler(update: Update) -> None:
+            await release.wait()
+
+        async def get_updates(offset: int | None, timeout: int) -> list[Mock]:
+            if offset == 5:
+                return [Mock(update_id=7)]
+            saved.append(offset_file.read_text())
+            if release.is_set():
+                raise asyncio.CancelledError
+            # Let the handler finish before the next poll
+            release.set()
+            await asyncio.gather(*(q.join() for q in TelegramBot._chat_workers.values()))
+            return []
+
+        TelegramBot._handler_registry.add(handler)
+        TelegramBot._bot = Mock()
+        TelegramBot._bot.get_updates = AsyncMock(side_effect=get_updates)
+        bot = TelegramBot.get_instance()
+
+        with pytest.raises(asyncio.CancelledError):
+            await bot._poll_updates()
+
+        # Update 7 stays replayable until its handler finishes
+        assert saved == ["7", "8"]
+        assert not list(tmp_path.glob("*.tmp"))
@@ -1,81 +1,106 @@
 """Tests for handlers module."""
 
-from unittest.mock import MagicMock
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+import pytest
+from telegram import Update
 
 from telegram_bot import HandlerRegistry
 
 
-class TestHandlerRegistry:
-    """Tests for the HandlerRegistry class."""
+@dataclass
+class UnhashableHandler:
+    """Callable dataclass handler; eq=True leaves it without a __hash__."""
 
-    def test_registry_add_handler(self) -> None:
-        """Test adding a handler to the registry."""
-        registry = HandlerRegistry()
-        handler = MagicMock()
+    name: str = "handler"
 
-        registry.add(handler)
+    def __call__(self, update: Update) -> None:
+        """Ignore the update."""
 
-        assert len(registry) == 1
-        assert handler in registry.handlers
 
-    def test_registry_add_duplicate_handler(self) -> None:
-        """Test that duplicate handlers are not added."""
-        registry = HandlerRegistry()
-        handler = MagicMock()
+def add(registry: HandlerRegistry, handler: Any) -> None:
+    """Register the handler."""
+    registry.add(handler)
 
-        registry.add(handler)
-        registry.add(handler)
 
-        assert len(registry) == 1
+def remove(registry: HandlerRegistry, handler: Any) -> bool:
+    """Unregister the handler."""
+    return registry.remove(handler)
 
-    def test_registry_remove_handler(self) -> None:
-        """Test removing a handler from the registry."""
-        registry = HandlerRegistry()
-        handler = MagicMock()
 
-        registry.add(handler)
-        result = registry.remove(handler)
+def clear(registry: HandlerRegistry, handler: Any) -> None:
+    """Unregister every handler."""
+    registry.clear()
 
-        assert result is True
-        assert len(registry) == 0
 
-    def test_registry_remove_nonexistent_handler(self) -> None:
-        """Test removing a handler that doesn't exist."""
-        registry = HandlerRegistry()
-        handler = MagicMock()
+Operation = Callable[[HandlerRegistry, Any], bool | None]
 
-        result = registry.remove(handler)
 
-        assert result is False
+@pytest.fixture
+def registry() -> HandlerRegistry:
+    """Create an empty handler registry."""
+    return HandlerRegistry()
 
-    def test_registry_clear(self) -> None:
-        """Test clearing all handlers."""
-        registry = HandlerRegistry()
-        registry.add(MagicMock())
-        registry.add(MagicMock())
 
-        registry.clear()
+@pytest.fixture(
+    params=[
+        pytest.param(object, id="hashable"),
+        pytest.param(UnhashableHandler, id="unhashable"),
+    ]
+)
+def handler(request: pytest.FixtureRequest) -> object:
+    """Create a placeholder message handler; the registry only hashes and compares it."""
+    return request.param()
 
-        assert len(registry) == 0
 
-    def test_registry_handlers_returns_copy(self) -> None:
-        """Test that handlers property returns a copy."""
-        registry = HandlerRegistry()
-        handler = MagicMock()
-        registry.add(handler)
+class TestHandlerRegistry:
+    """Tests for the HandlerRegistry class."""
+
+    @pytest.mark.parametrize(
+        ("ops", "expected_len", "expected_result"),
+        [
+            pytest.param((add,), 1, None, id="add"),
+            pytest.param((add, add), 1, None, id="add-duplicate"),
+            pytest.param((add, remove), 0, True, id="remove"),
+            pytest.param((remove,), 0, False, id="remove-missing"),
+            pytest.param((add, clear), 0, None, id="clear"),
+        ],
+    )
+    def test_registry_operations(
+        self,
+        registry: HandlerRegistry,
+        handler: object,
+        ops: tuple[Operation, ...],
+        expected_len: int,
+        expected_result: bool | None,
+    ) -> None:
+        """Test that add/remove/clear leave the registry in the expected state."""
+        result = None
+        for op in ops:
+            result = op(registry, handler)
+
+        assert result is expected_result
+        assert len(registry) == expected_len
+        assert (handler in registry) is (expected_len == 1)
+
+    def test_registry_handlers_returns_snapshot(
+        self, registry: HandlerRegistry, handler: object
+    ) -> None:
+        """Test that handlers property returns an immutable snapshot."""
+        registry.add(handler)  # type: ignore[arg-type]
 
         handlers = registry.handlers
-        handlers.clear()  # Modify the copy
+        registry.add(object())  # type: ignore[arg-type]
 
-        assert len(registry) == 1  # Original unchanged
+        assert isinstance(handlers, tuple)
+        assert handlers == (handler,)  # Snapshot unchanged
 
-    def test_registry_bool_empty(self) -> None:
-        """Test bool returns False for empty registry."""
-        registry = HandlerRegistry()
-        assert not registry
+    @pytest.mark.parametrize(("count", "expected"), [(0, False), (1, True)])
+    def test_registry_bool(self, registry: HandlerRegistry, count: int, expected: bool) -> None:
+        """Test bool reflects whether any handlers are registered."""
+        for _ in range(count):
+            registry.add(object())  # type: ignore[arg-type]
 
-    def test_registry_bool_with_handlers(self) -> None:
-        """Test bool returns True with handlers."""
-        registry = HandlerRegistry()
-        registry.add(MagicMock())
-        assert registry
+        assert bool(registry) is expected
@@ -1,101 +1,188 @@
 """Tests for settings module."""
 
+import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from telegram_bot import Settings, get_settings
 from telegram_bot.config import CONSTANTS
 
+_ENV_FILES: dict[str, dict[str, str]] = {
+    "basic": {
+        "TELEGRAM_BOT_TOKEN": "file_token",
+        "TELEGRAM_CHANNEL_ID": "@file_channel",
+        "TELEGRAM_BASE_URL": "https://file.example.com",
+    },
+    "numeric": {
+        "TELEGRAM_BOT_TOKEN": "test_token",
+        "TELEGRAM_CHANNEL_ID": "@test_channel",
+        "TELEGRAM_POLL_TIMEOUT": "60",
+        "TELEGRAM_RETRY_DELAY": "10.5",
+        "TELEGRAM_SEND_DELAY": "0.5",
+    },
+    "allowed-user-ids": {
+        "TELEGRAM_BOT_TOKEN": "test_token",
+        "TELEGRAM_CHANNEL_ID": "@test_channel",
+        "TELEGRAM_ALLOWED_USER_IDS": "123, 456,",
+    },
+}
+
+_ENV_CASES = [
+    pytest.param(
+        "basic",
+        {
+            "bot_token": "file_token",
+            "channel_id": "@file_channel",
+            "base_url": "https://file.example.com",
+        },
+        id="basic",
+    ),
+    pytest.param(
+        "numeric",
+        {"poll_timeout": 60, "retry_delay": 10.5, "send_delay": 0.5},
+        id="numeric",
+    ),
+    pytest.param(
+        "allowed-user-ids",
+        {"allowed_user_ids": frozenset({123, 456})},
+        id="allowed-user-ids",
+    ),
+]
+
+_EXPECTED_DEFAULTS = (
+    CONSTANTS.DEFAULT_BASE_URL,
+    CONSTANTS.DEFAULT_PARSE_MODE,
+    CONSTANTS.DEFAULT_POLL_TIMEOUT,
+    CONSTANTS.DEFAULT_RETRY_DELAY,
+    CONSTANTS.DEFAULT_SEND_DELAY,
+)
+
+
+@pytest.fixture(scope="module")
+def base_settings() -> Settings:
+    """Create one valid, read-only Settings instance shared by the module."""
+    return Settings(bot_token="test_token", channel_id="@test_channel")
+
+
+@pytest.fixture(scope="module")
+def env_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write each read-only .env file in _ENV_FILES once for the module."""
+    env_dir = tmp_path_factory.mktemp("envs")
+    for name, env in _ENV_FILES.items():
+        env_text = "".join(f"{key}={value}\n" for key, value in env.items())
+        (env_dir / f"{name}.env").write_text(env_text)
+    return env_dir
+
 
 class TestSettings:
     """Tests for the Settings dataclass."""
 
-    def test_settings_creation(self) -> None:
+    def test_settings_creation(self, base_settings: Settings) -> None:
         """Test creating settings with valid values."""
-        settings = Settings(
-            bot_token="test_token",
-            channel_id="@test_channel",
-        )
+        settings = base_settings
         assert settings.bot_token == "test_token"
         assert settings.channel_id == "@test_channel"
 
-    def test_settings_immutable(self) -> None:
+    def test_settings_immutable(self, base_settings: Settings) -> None:
         """Test that settings are immutable (frozen)."""
+        with pytest.raises(AttributeError):
+            base_settings.bot_token = "new_token"  # type: ignore[misc]
+
+    def test_settings_default_values(self, base_settings: Settings) -> None:
+        """Test default values are applied."""
+        settings = base_settings
+        assert (
+            settings.base_url,
+            settings.parse_mode,
+            settings.poll_timeout,
+            settings.retry_delay,
+            settings.send_delay,
+        ) == _EXPECTED_DEFAULTS
+
+    @pytest.mark.parametrize(
+        ("bot_token", "channel_id", "message"),
+        [
+            pytest.param("", "@test_channel", "Bot token is required", id="bot-token"),
+            pytest.param("test_token", "", "Channel ID is required", id="channel-id"),
+        ],
+    )
+    def test_settings_missing_required(self, bot_token: str, channel_id: str, message: str) -> None:
+        """Test that a missing required field raises ValueError."""
+        with pytest.raises(ValueError, match=message):
+            Settings(bot_token=bot_token, channel_id=channel_id)
+
+    @pytest.mark.parametrize(
+        ("channel_id", "expected"),
+        [
+            pytest.param("@my_channel", "@my_channel", id="with-at"),
+            pytest.param("my_channel", "@my_channel", id="without-at"),
+            pytest.param("-100123456789", "-100123456789", id="numeric"),
+        ],
+    )
+    def test_normalized_channel_id(self, channel_id: str, expected: str) -> None:
+        """Test normalized_channel_id adds a missing @ prefix but preserves numeric IDs."""
+        settings = Settings(bot_token="test_token", channel_id=channel_id)
+        assert settings.normalized_channel_id == expected
+
+    def test_allowed_user_ids_frozen(self) -> None:
+        """Test allowed_user_ids is stored as a frozenset."""
         settings = Settings(
             bot_token="test_token",
             channel_id="@test_channel",
+            allowed_user_ids={1, 2},  # type: ignore[arg-type]  # coerced at runtime
         )
-        with pytest.raises(AttributeError):
-            settings.bot_token = "new_token"  # type: ignore[misc]
+        assert settings.allowed_user_ids == frozenset({1, 2})
+        assert isinstance(settings.allowed_user_ids, frozenset)
 
-    def test_settings_default_values(self) -> None:
-        """Test default values are applied."""
+    def test_base_url_prefix_strips_trailing_slash(self) -> None:
+        """Test base_url_prefix drops the trailing slash from base_url."""
         settings = Settings(
             bot_token="test_token",
             channel_id="@test_channel",
+            base_url="https://example.com/",
         )
-        assert settings.base_url == CONSTANTS.DEFAULT_BASE_URL
-        assert settings.parse_mode == CONSTANTS.DEFAULT_PARSE_MODE
-        assert settings.poll_timeout == CONSTANTS.DEFAULT_POLL_TIMEOUT
-        assert settings.retry_delay == CONSTANTS.DEFAULT_RETRY_DELAY
-        assert settings.send_delay == CONSTANTS.DEFAULT_SEND_DELAY
-
-    def test_settings_missing_bot_token(self) -> None:
-        """Test that missing bot_token raises ValueError."""
-        with pytest.raises(ValueError, match="Bot token is required"):
-            Settings(bot_token="", channel_id="@test_channel")
-
-    def test_settings_missing_channel_id(self) -> None:
-        """Test that missing channel_id raises ValueError."""
-        with pytest.raises(ValueError, match="Channel ID is required"):
-            Settings(bot_token="test_token", channel_id="")
-
-    def test_normalized_channel_id_with_at(self) -> None:
-        """Test normalized_channel_id when already has @ prefix."""
-        settings = Settings(bot_token="test_token", channel_id="@my_channel")
-        assert settings.normalized_channel_id == "@my_channel"
-
-    def test_normalized_channel_id_without_at(self) -> None:
-        """Test normalized_channel_id adds @ prefix."""
-        settings = Settings(bot_token="test_token", channel_id="my_channel")
-        assert settings.normalized_channel_id == "@my_channel"
-
-    def test_normalized_channel_id_numeric(self) -> None:
-        """Test normalized_channel_id preserves numeric IDs."""
-        settings = Settings(bot_token="test_token", channel_id="-100123456789")
-        assert settings.normalized_channel_id == "-100123456789"
+        assert settings.base_url_prefix == "https://example.com"
 
 
 class TestGetSettings:
     """Tests for the get_settings function."""
 
-    def test_get_settings_from_env_file(self, tmp_path: Path) -> None:
+    @pytest.mark.parametrize(("name", "expected"), _ENV_CASES)
+    def test_get_settings_from_env_file(
+        self, env_dir: Path, name: str, expected: dict[str, object]
+    ) -> None:
         """Test loading settings from an .env file."""
+        # Keep load_dotenv from leaking variables into later tests
+        with patch.dict(os.environ):
+            settings = get_settings(env_dir / f"{name}.env")
+
+        for field_name, value in expected.items():
+            assert getattr(settings, field_name) == value
+
+    @pytest.mark.parametrize(("name", "expected"), _ENV_CASES)
+    def test_get_settings_from_environment(
+        self, monkeypatch: pytest.MonkeyPatch, name: str, expected: dict[str, object]
+    ) -> None:
+        """Test loading settings from environment variables without an .env file."""
+        for key, env_value in _ENV_FILES[name].items():
+            monkeypatch.setenv(key, env_value)
+
+        # Keep load_dotenv from leaking a developer's .env into later tests
+        with patch.dict(os.environ):
+            settings = get_settings(None)
+
+        for field_name, value in expected.items():
+            assert getattr(settings, field_name) == value
+
+    def test_get_settings_is_cached(self, tmp_path: Path) -> None:
+        """Test that repeated calls for the same env file reuse the parsed Settings."""
         env_file = tmp_path / ".env"
-        env_file.write_text(
-            "TELEGRAM_BOT_TOKEN=file_token\n"
-            "TELEGRAM_CHANNEL_ID=@file_channel\n"
-            "TELEGRAM_BASE_URL=https://file.example.com\n"
-        )
+        env_file.write_text("TELEGRAM_BOT_TOKEN=test_token\nTELEGRAM_CHANNEL_ID=@test_channel\n")
 
-        settings = get_settings(env_file)
-        assert settings.bot_token == "file_token"
-        assert settings.channel_id == "@file_channel"
-        assert settings.base_url == "https://file.example.com"
-
-    def test_get_settings_numeric_values(self, tmp_path: Path) -> None:
-        """Test loading numeric settings from env file."""
-        env_file = tmp_path / ".env"
-        env_file.write_text(
-            "TELEGRAM_BOT_TOKEN=test_token\n"
-            "TELEGRAM_CHANNEL_ID=@test_channel\n"
-            "TELEGRAM_POLL_TIMEOUT=60\n"
-            "TELEGRAM_RETRY_DELAY=10.5\n"
-            "TELEGRAM_SEND_DELAY=0.5\n"
-        )
+        with patch.dict(os.environ):
+            first = get_settings(env_file)
+            env_file.write_text("TELEGRAM_BOT_TOKEN=other\nTELEGRAM_CHANNEL_ID=@other\n")
 
-        settings = get_settings(env_file)
-        assert settings.poll_timeout == 60
-        assert settings.retry_delay == 10.5
-        assert settings.send_delay == 0.5
+            assert get_settings(env_file) is first